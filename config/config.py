@@ -18,6 +18,9 @@ DB_PASSWORD = ""
 EXPORT_DIR = "exports"
 CSV_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 
+# Cache Configuration
+HISTORICAL_CACHE_DIR = ".cache/sofascore_history"
+
 # Logging Configuration
 LOG_LEVEL = "INFO"
 LOG_FILE = "pipeline.log"
@@ -6,6 +6,7 @@ Fetches upcoming match schedules and fixture data
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 
@@ -43,38 +44,31 @@ class FixtureScraper:
             self.logger.warning(f"No fixture data received for {date_str}")
             return []
         
-        fixtures = []
-        events = data.get('events', [])
-        
-        for event in events:
-            fixture_data = self._extract_fixture_info(event)
-            if fixture_data:
-                fixtures.append(fixture_data)
+        fixtures = self._extract_fixtures(data.get('events', []))
         
         self.logger.info(f"Found {len(fixtures)} fixtures for {date_str}")
         return fixtures
     
-    def get_upcoming_fixtures(self, days_ahead=7):
+    def get_upcoming_fixtures(self, days_ahead=7, concurrency=3):
         """
-        Fetch fixtures for the next N days
+        Fetch fixtures for the next N days, issuing the per-date requests concurrently
         
         Args:
             days_ahead (int): Number of days to look ahead
+            concurrency (int): Maximum number of requests in flight at once
             
         Returns:
-            list: List of all upcoming fixtures
+            list: List of all upcoming fixtures, in date order
         """
         self.logger.info(f"Fetching fixtures for next {days_ahead} days")
         
-        all_fixtures = []
         current_date = datetime.now().date()
+        dates = [(current_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days_ahead)]
         
-        for i in range(days_ahead):
-            date = current_date + timedelta(days=i)
-            date_str = date.strftime('%Y-%m-%d')
-            
-            daily_fixtures = self.get_fixtures_by_date(date_str)
-            all_fixtures.extend(daily_fixtures)
+        # Dates are independent; the shared rate limiter in make_api_request still spaces request starts
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = pool.map(self.get_fixtures_by_date, dates)
+            all_fixtures = [fixture for daily_fixtures in results for fixture in daily_fixtures]
         
         self.logger.info(f"Total upcoming fixtures found: {len(all_fixtures)}")
         return all_fixtures
@@ -99,25 +93,22 @@ class FixtureScraper:
             self.logger.warning(f"No tournament fixture data received")
             return []
         
-        fixtures = []
-        events = data.get('events', [])
+        fixtures = self._extract_fixtures(data.get('events', []))
         
-        for event in events:
-            fixture_data = self._extract_fixture_info(event)
-            if fixture_data:
-                fixture_data['tournament_id'] = tournament_id
-                fixture_data['season_id'] = season_id
-                fixtures.append(fixture_data)
+        for fixture_data in fixtures:
+            fixture_data['tournament_id'] = tournament_id
+            fixture_data['season_id'] = season_id
         
         self.logger.info(f"Found {len(fixtures)} tournament fixtures")
         return fixtures
     
-    def _extract_fixture_info(self, event):
+    def _extract_fixture_info(self, event, scraped_at):
         """
         Extract fixture information from event data
         
         Args:
             event (dict): Event data from API
+            scraped_at (str): ISO timestamp of the response the event came from
             
         Returns:
             dict: Processed fixture data
@@ -140,12 +131,31 @@ class FixtureScraper:
                 'round_info': event.get('roundInfo', {}).get('name'),
                 'status': event.get('status', {}).get('description'),
                 'venue': event.get('venue', {}).get('name') if event.get('venue') else None,
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at
             }
         except Exception as e:
             self.logger.error(f"Error extracting fixture info: {e}")
             return None
     
+    def _extract_fixtures(self, events):
+        """
+        Extract fixture information for each event in a response
+        
+        Args:
+            events (list): Event data from API
+            
+        Returns:
+            list: Processed fixture data dictionaries (events that fail extraction are skipped)
+        """
+        # Every fixture in a response was scraped at the same moment
+        scraped_at = datetime.now().isoformat()
+        fixtures = []
+        for event in events:
+            fixture_data = self._extract_fixture_info(event, scraped_at)
+            if fixture_data:
+                fixtures.append(fixture_data)
+        return fixtures
+    
     def get_popular_tournaments(self):
         """
         Get list of popular football tournaments
@@ -209,12 +219,12 @@ class FixtureScraper:
             pd.DataFrame: DataFrame of fixtures
         """
         if isinstance(fixtures_data, dict):
-            # Combine all fixture types
-            all_fixtures = []
-            for fixture_type, fixtures in fixtures_data.items():
-                for fixture in fixtures:
-                    fixture['source_type'] = fixture_type
-                    all_fixtures.append(fixture)
-            return pd.DataFrame(all_fixtures)
+            # Combine all fixture types, tagging each block with its source column-wise
+            frames = [
+                pd.DataFrame(fixtures).assign(source_type=fixture_type)
+                for fixture_type, fixtures in fixtures_data.items()
+                if fixtures
+            ]
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
         
         return pd.DataFrame(fixtures_data)
\ No newline at end of file
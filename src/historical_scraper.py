@@ -9,17 +9,99 @@ import sys
 import os
 import time
 import json
+import csv
 import random
-from datetime import datetime, timedelta
+import threading
+import zlib
+import heapq
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from datetime import datetime
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 
+# Persistent cache for finished-match details (optional)
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 # Add config to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import HISTORICAL_CACHE_DIR, RATE_LIMIT_DELAY
 
 # Local imports
-from utils import setup_logging, safe_get_nested
+from utils import setup_logging, safe_get_nested, json_dumps, json_loads, get_rate_limiter, parse_retry_after, MAX_SERVER_PAUSE
+
+_by_minute = itemgetter('minute')
+
+# Feed periods counted as regular match play (penalty shootouts are excluded)
+_REGULAR_PERIODS = frozenset(("1H", "2H"))
+
+# Upper bound for a single retry backoff (seconds)
+MAX_BACKOFF_DELAY = 60
+
+# How long responses for past dates stay in the on-disk cache
+PAST_DATE_CACHE_TTL = 30 * 24 * 3600
+
+# Tournament seasons whose event lists are kept in memory per scraper
+TOURNAMENT_EVENTS_CACHE_SIZE = 32
+
+# Version of the cached match-details layout; bump whenever extraction output changes
+MATCH_DETAILS_CACHE_VERSION = 2
+
+# Team endpoints tried in order by Strategy 1 of match discovery
+_TEAM_ENDPOINT_PATHS = (
+    "/team/{team_id}/events/last/0",
+    "/team/{team_id}/events/last/1",
+    "/team/{team_id}/matches/last/0",
+    "/team/{team_id}/matches/last/1"
+)
+
+# Per-match endpoints fetched together by extract_accurate_match_details
+_EVENT_ENDPOINT_PATHS = ("", "/incidents", "/statistics", "/summary")
+
+# Statistic name substrings in match priority order: the first pattern found in the name wins
+_TEAM_STAT_PATTERNS = (
+    ('ball possession', 'possession_pct'),
+    ('shots on target', 'shots_on_target'),
+    ('total shots', 'total_shots'),
+    ('corner kicks', 'corners'),
+    ('fouls', 'fouls'),
+    ('yellow cards', 'yellow_cards'),
+    ('red cards', 'red_cards'),
+    ('passes', 'total_passes'),
+    ('accurate passes', 'accurate_passes'),
+    ('tackles', 'tackles'),
+    ('interceptions', 'interceptions'),
+    ('clearances', 'clearances'),
+    ('saves', 'goalkeeper_saves'),
+    ('offsides', 'offsides')
+)
+
+@lru_cache(maxsize=256)
+def _team_stat_field(stat_name: str) -> Optional[str]:
+    """Map a lower-cased SofaScore statistic name to its export field (None when unmapped)"""
+    for pattern, field in _TEAM_STAT_PATTERNS:
+        if pattern in stat_name:
+            if field == 'total_passes' and 'accurate' in stat_name:
+                continue
+            return field
+    return None
+
+# Canonical SofaScore names resolve with one dict hit, skipping lower() and the substring scan
+_EXACT_TEAM_STATS = {
+    name: _team_stat_field(name.lower()) for name in (
+        'Ball possession', 'Shots on target', 'Total shots', 'Corner kicks', 'Fouls',
+        'Yellow cards', 'Red cards', 'Passes', 'Accurate passes', 'Tackles',
+        'Interceptions', 'Clearances', 'Goalkeeper saves', 'Offsides'
+    )
+}
 
 class AccurateHistoricalScraper:
     """Enhanced scraper with guaranteed accuracy and comprehensive validation"""
@@ -42,6 +124,14 @@ class AccurateHistoricalScraper:
             'Pragma': 'no-cache'
         }
         
+        # One pooled session so every request reuses the same keep-alive connection
+        # (sized for concurrent matches x concurrent endpoints per match)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Enhanced competition mappings with multiple seasons
         self.competitions = {
             # Premier League
@@ -71,49 +161,87 @@ class AccurateHistoricalScraper:
         self.request_count = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self._stats_lock = threading.Lock()
+        
+        # Requests fanned out at once; pacing comes from the configured delay, shared process-wide
+        self.max_workers = 4
+        self.rate_limiter = get_rate_limiter(RATE_LIMIT_DELAY)
+        
+        # Finished matches and past dates never change, so their data is kept across runs
+        self.cache = Cache(HISTORICAL_CACHE_DIR) if DISKCACHE_AVAILABLE else None
+        
+        # Tournament-wide event lists, shared by every team looked up with this scraper (LRU-bounded)
+        self._tournament_events_cache: OrderedDict[Tuple[int, int], Dict] = OrderedDict()
         
-    def make_robust_request(self, url: str, max_retries: int = 4, backoff_factor: float = 1.5) -> Optional[Dict]:
-        """Enhanced API request with exponential backoff and comprehensive error handling"""
+    def make_robust_request(self, url: str, max_retries: int = 4, backoff_factor: float = 1.5,
+                            cache_ttl: Optional[int] = None) -> Optional[Dict]:
+        """Enhanced API request with exponential backoff and comprehensive error handling
         
-        self.request_count += 1
+        Responses for immutable URLs can be kept on disk by passing cache_ttl (seconds).
+        """
+        
+        cache_key = ('url', url)
+        if cache_ttl is not None and self.cache is not None:
+            cached_blob = self.cache.get(cache_key)
+            if cached_blob is not None:
+                self.logger.info(f"Using cached response: {url}")
+                return json_loads(zlib.decompress(cached_blob))
+        
+        with self._stats_lock:
+            self.request_count += 1
+            request_number = self.request_count
         
+        retry_after = None
         for attempt in range(max_retries):
             try:
-                # Progressive delay with jitter
-                if attempt > 0:
-                    delay = backoff_factor ** attempt + random.uniform(0, 1)
+                # Full-jitter backoff, unless the server said when to retry (the rate limiter then holds us)
+                if attempt > 0 and retry_after is None:
+                    delay = random.uniform(0, min(MAX_BACKOFF_DELAY, backoff_factor * 2 ** attempt))
                     self.logger.info(f"Waiting {delay:.1f}s before retry...")
                     time.sleep(delay)
-                else:
-                    time.sleep(1.0 + random.uniform(0, 0.5))  # Base delay
+                retry_after = None
+                
+                # Shared token bucket: only blocks when requests arrive faster than the allowed rate
+                self.rate_limiter.acquire()
                 
-                self.logger.info(f"Request {self.request_count} - Attempt {attempt + 1}: {url}")
+                self.logger.info(f"Request {request_number} - Attempt {attempt + 1}: {url}")
                 
-                response = requests.get(url, headers=self.headers, timeout=20)
+                response = self.session.get(url, timeout=20)
+                self.rate_limiter.update_from_headers(response.headers)
                 
                 # Log response details
                 self.logger.info(f"Response: {response.status_code} | Size: {len(response.content)} bytes")
                 
                 if response.status_code == 200:
                     try:
-                        data = response.json()
-                        self.successful_requests += 1
+                        data = json_loads(response.content)
+                        with self._stats_lock:
+                            self.successful_requests += 1
                         self.logger.info(f"✅ Success! Data keys: {list(data.keys()) if isinstance(data, dict) else type(data)}")
+                        if cache_ttl is not None and self.cache is not None:
+                            # Raw responses are repetitive JSON, so store them compressed
+                            self.cache.set(cache_key, zlib.compress(json_dumps(data), 6), expire=cache_ttl)
                         return data
                     except json.JSONDecodeError as e:
                         self.logger.error(f"JSON decode error: {e}")
-                        self.logger.debug(f"Response content: {response.text[:500]}...")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Response content: {response.text[:500]}...")
                         continue
                         
                 elif response.status_code == 404:
                     self.logger.warning(f"404 - Endpoint not found: {url}")
-                    self.failed_requests += 1
+                    with self._stats_lock:
+                        self.failed_requests += 1
                     return None  # Don't retry for 404s
                     
                 elif response.status_code == 429:
-                    wait_time = (2 ** attempt) * 2 + random.uniform(0, 3)
-                    self.logger.warning(f"Rate limited. Waiting {wait_time:.1f} seconds...")
-                    time.sleep(wait_time)
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None:
+                        # The shared limiter caps the pause, so one hint cannot stall every worker for long
+                        retry_after = min(retry_after, MAX_SERVER_PAUSE)
+                        self.logger.warning(f"Rate limited. Waiting {retry_after:.1f} seconds as the server asked...")
+                    else:
+                        self.logger.warning("Rate limited. Backing off...")
                     continue
                     
                 elif response.status_code in [500, 502, 503]:
@@ -135,10 +263,40 @@ class AccurateHistoricalScraper:
                 self.logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
                 continue
         
-        self.failed_requests += 1
+        with self._stats_lock:
+            self.failed_requests += 1
         self.logger.error(f"❌ All {max_retries} attempts failed for {url}")
         return None
     
+    def _get_tournament_events(self, tournament_id: int, season_id: int) -> Optional[Dict]:
+        """Fetch a tournament season's recent events once per scraper (filtered per team by the caller)"""
+        key = (tournament_id, season_id)
+        data = self._tournament_events_cache.get(key)
+        if data is not None:
+            self._tournament_events_cache.move_to_end(key)
+            return data
+        
+        data = self.make_robust_request(
+            f"{self.base_url}/unique-tournament/{tournament_id}/season/{season_id}/events/last/0"
+        )
+        # Failed fetches are not remembered, so the next team retries after an outage
+        if data is not None:
+            self._tournament_events_cache[key] = data
+            if len(self._tournament_events_cache) > TOURNAMENT_EVENTS_CACHE_SIZE:
+                self._tournament_events_cache.popitem(last=False)
+        return data
+    
+    @staticmethod
+    def _finished_team_events(events: List[Dict], team_id: int):
+        """Yield finished events involving team_id, rejecting other teams' fixtures first"""
+        for event in events:
+            # Most events on competition and date pages belong to other teams
+            if ((event.get('homeTeam') or {}).get('id') != team_id and
+                    (event.get('awayTeam') or {}).get('id') != team_id):
+                continue
+            if event.get('id') and (event.get('status') or {}).get('type') == 'finished':
+                yield event
+    
     def get_team_matches_comprehensive(self, team_id: int, max_matches: int = 10) -> List[Dict]:
         """Get team matches using multiple comprehensive strategies"""
         
@@ -149,22 +307,17 @@ class AccurateHistoricalScraper:
         
         # Strategy 1: Direct team endpoints (multiple variations)
         self.logger.info("📊 Strategy 1: Direct team endpoints...")
-        team_endpoints = [
-            f"{self.base_url}/team/{team_id}/events/last/0",
-            f"{self.base_url}/team/{team_id}/events/last/1", 
-            f"{self.base_url}/team/{team_id}/matches/last/0",
-            f"{self.base_url}/team/{team_id}/matches/last/1"
-        ]
-        
-        for endpoint in team_endpoints:
+        for path in _TEAM_ENDPOINT_PATHS:
+            endpoint = self.base_url + path.format(team_id=team_id)
             data = self.make_robust_request(endpoint)
-            if data and 'events' in data:
+            events = data.get('events') if data else None
+            if events is not None:
                 new_matches = 0
-                for event in data['events']:
+                for event in events:
                     match_id = event.get('id')
                     if match_id and match_id not in unique_match_ids:
                         # Only include finished matches
-                        status_type = safe_get_nested(event, ['status', 'type'])
+                        status_type = (event.get('status') or {}).get('type')
                         if status_type == 'finished':
                             unique_match_ids.add(match_id)
                             all_matches.append(event)
@@ -181,23 +334,14 @@ class AccurateHistoricalScraper:
                 break  # Have enough matches
                 
             for season_id in comp_info['season_ids']:
-                comp_data = self.make_robust_request(
-                    f"{self.base_url}/unique-tournament/{tournament_id}/season/{season_id}/events/last/0"
-                )
+                comp_data = self._get_tournament_events(tournament_id, season_id)
                 
-                if comp_data and 'events' in comp_data:
+                events = comp_data.get('events') if comp_data else None
+                if events is not None:
                     new_matches = 0
-                    for event in comp_data['events']:
-                        home_id = safe_get_nested(event, ['homeTeam', 'id'])
-                        away_id = safe_get_nested(event, ['awayTeam', 'id'])
-                        match_id = event.get('id')
-                        status_type = safe_get_nested(event, ['status', 'type'])
-                        
-                        if (match_id and 
-                            (home_id == team_id or away_id == team_id) and 
-                            status_type == 'finished' and 
-                            match_id not in unique_match_ids):
-                            
+                    for event in self._finished_team_events(events, team_id):
+                        match_id = event['id']
+                        if match_id not in unique_match_ids:
                             unique_match_ids.add(match_id)
                             all_matches.append(event)
                             new_matches += 1
@@ -223,70 +367,77 @@ class AccurateHistoricalScraper:
                 if len(all_matches) >= max_matches * 1.5:
                     break
                 
-                for days_back in range(start_days, end_days, 5):
-                    search_date = current_date - timedelta(days=days_back)
-                    date_str = search_date.strftime('%Y-%m-%d')
-                    
-                    date_data = self.make_robust_request(
-                        f"{self.base_url}/sport/football/scheduled-events/{date_str}"
-                    )
-                    
-                    if date_data and 'events' in date_data:
-                        for event in date_data['events']:
-                            home_id = safe_get_nested(event, ['homeTeam', 'id'])
-                            away_id = safe_get_nested(event, ['awayTeam', 'id'])
-                            match_id = event.get('id')
-                            status_type = safe_get_nested(event, ['status', 'type'])
-                            
-                            if (match_id and 
-                                (home_id == team_id or away_id == team_id) and 
-                                status_type == 'finished' and 
-                                match_id not in unique_match_ids):
-                                
-                                unique_match_ids.add(match_id)
-                                all_matches.append(event)
-                    
-                    if len(all_matches) >= max_matches * 2:
-                        break
-        
-        # Sort by date (most recent first)
-        all_matches.sort(key=lambda x: x.get('startTimestamp', 0), reverse=True)
+                # Format the whole range of search dates in one vectorized call
+                search_dates = (pd.Timestamp(current_date)
+                                - pd.to_timedelta(range(start_days, end_days, 5), unit='D')).strftime('%Y-%m-%d')
+                
+                # Dates in a range are independent, so fetch them concurrently
+                urls = [f"{self.base_url}/sport/football/scheduled-events/{date_str}" for date_str in search_dates]
+                
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    # Every search date is at least a week old, so its fixture list is final
+                    fetch = partial(self.make_robust_request, cache_ttl=PAST_DATE_CACHE_TTL)
+                    for date_data in pool.map(fetch, urls):
+                        events = date_data.get('events') if date_data else None
+                        if events is not None:
+                            for event in self._finished_team_events(events, team_id):
+                                match_id = event['id']
+                                if match_id not in unique_match_ids:
+                                    unique_match_ids.add(match_id)
+                                    all_matches.append(event)
+                        
+                        if len(all_matches) >= max_matches * 2:
+                            # Enough matches: drop the dates that have not started yet
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            break
         
         self.logger.info(f"✅ Found {len(all_matches)} total unique finished matches")
-        return all_matches[:max_matches]
+        
+        # Most recent first; only max_matches are kept, so skip the full sort
+        return heapq.nlargest(max_matches, all_matches, key=lambda x: x.get('startTimestamp', 0))
     
     def extract_accurate_match_details(self, match_event: Dict, team_id: int) -> Dict:
         """Extract accurate match details with multi-source validation"""
         
         match_id = match_event.get('id')
-        home_team = safe_get_nested(match_event, ['homeTeam', 'name'])
-        away_team = safe_get_nested(match_event, ['awayTeam', 'name'])
+        home_team = (match_event.get('homeTeam') or {}).get('name')
+        away_team = (match_event.get('awayTeam') or {}).get('name')
         
         self.logger.info(f"🔍 Extracting details for: {home_team} vs {away_team} (ID: {match_id})")
         
-        # Get comprehensive match data from multiple endpoints
-        match_data = self.make_robust_request(f"{self.base_url}/event/{match_id}")
-        incidents_data = self.make_robust_request(f"{self.base_url}/event/{match_id}/incidents")
-        stats_data = self.make_robust_request(f"{self.base_url}/event/{match_id}/statistics")
-        summary_data = self.make_robust_request(f"{self.base_url}/event/{match_id}/summary")
+        cache_key = ('details', MATCH_DETAILS_CACHE_VERSION, match_id, team_id)
+        if self.cache is not None:
+            cached_details = self.cache.get(cache_key)
+            if cached_details is not None:
+                self.logger.info(f"Using cached details for match {match_id}")
+                return cached_details
+        
+        # Get comprehensive match data from multiple endpoints (independent, so fetched together)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            event_url = f"{self.base_url}/event/{match_id}"
+            match_data, incidents_data, stats_data, summary_data = pool.map(
+                self.make_robust_request, [event_url + path for path in _EVENT_ENDPOINT_PATHS])
+        
+        # Team perspective is fixed for the match, so resolve it once for every helper
+        team_is_home = (match_event.get('homeTeam') or {}).get('id') == team_id
         
         # Base match information
         match_details = {
             'match_id': match_id,
             'date': self._extract_match_date(match_event),
-            'opponent': self._extract_opponent(match_event, team_id),
-            'venue_type': self._extract_venue_type(match_event, team_id),
-            'competition': safe_get_nested(match_event, ['tournament', 'name']),
-            'round_info': safe_get_nested(match_event, ['roundInfo', 'name'])
+            'opponent': self._extract_opponent(match_event, team_is_home),
+            'venue_type': self._extract_venue_type(team_is_home),
+            'competition': (match_event.get('tournament') or {}).get('name'),
+            'round_info': (match_event.get('roundInfo') or {}).get('name')
         }
         
         # Extract scores with multi-source validation
-        scores = self._extract_accurate_scores(match_event, match_data, summary_data, team_id)
+        scores = self._extract_accurate_scores(match_event, match_data, summary_data, team_is_home)
         match_details.update(scores)
         
         # Extract statistics
         if stats_data:
-            team_stats = self._extract_team_statistics(stats_data, team_id, match_event)
+            team_stats = self._extract_team_statistics(stats_data, team_is_home)
             match_details.update(team_stats)
         else:
             match_details.update(self._get_default_stats())
@@ -304,34 +455,41 @@ class AccurateHistoricalScraper:
         # Validate data consistency
         self._validate_match_data(match_details)
         
+        # Only cache complete, consistent results so transient failures get retried next run
+        if (self.cache is not None and
+                None not in (match_data, incidents_data, stats_data, summary_data) and
+                len(match_details.get('goal_times', [])) == match_details['goals_scored'] and
+                len(match_details.get('goal_conceded_times', [])) == match_details['goals_conceded']):
+            self.cache.set(cache_key, match_details)
+        
         return match_details
     
     def _extract_accurate_scores(self, match_event: Dict, match_data: Dict, 
-                                summary_data: Dict, team_id: int) -> Dict:
+                                summary_data: Dict, team_is_home: bool) -> Dict:
         """Extract scores with multi-source validation"""
         
         # Try multiple sources for scores
         score_sources = []
         
         # Source 1: Original event
-        home_score_1 = safe_get_nested(match_event, ['homeScore', 'current'])
-        away_score_1 = safe_get_nested(match_event, ['awayScore', 'current'])
+        home_score_1 = (match_event.get('homeScore') or {}).get('current')
+        away_score_1 = (match_event.get('awayScore') or {}).get('current')
         if home_score_1 is not None and away_score_1 is not None:
             score_sources.append(('event', home_score_1, away_score_1))
         
         # Source 2: Match data
         if match_data:
             event_obj = match_data.get('event', match_data)
-            home_score_2 = safe_get_nested(event_obj, ['homeScore', 'current'])
-            away_score_2 = safe_get_nested(event_obj, ['awayScore', 'current'])
+            home_score_2 = (event_obj.get('homeScore') or {}).get('current')
+            away_score_2 = (event_obj.get('awayScore') or {}).get('current')
             if home_score_2 is not None and away_score_2 is not None:
                 score_sources.append(('match_data', home_score_2, away_score_2))
         
         # Source 3: Summary data
         if summary_data:
             event_obj = summary_data.get('event', summary_data)
-            home_score_3 = safe_get_nested(event_obj, ['homeScore', 'current'])
-            away_score_3 = safe_get_nested(event_obj, ['awayScore', 'current'])
+            home_score_3 = (event_obj.get('homeScore') or {}).get('current')
+            away_score_3 = (event_obj.get('awayScore') or {}).get('current')
             if home_score_3 is not None and away_score_3 is not None:
                 score_sources.append(('summary_data', home_score_3, away_score_3))
         
@@ -345,15 +503,12 @@ class AccurateHistoricalScraper:
         self.logger.info(f"Using scores from {source_name}: {home_score}-{away_score}")
         
         # Determine team perspective
-        home_team_id = safe_get_nested(match_event, ['homeTeam', 'id'])
-        if home_team_id == team_id:
+        if team_is_home:
             team_goals = home_score
             opponent_goals = away_score
-            team_is_home = True
         else:
             team_goals = away_score
             opponent_goals = home_score
-            team_is_home = False
         
         # Calculate result
         if team_goals > opponent_goals:
@@ -370,11 +525,10 @@ class AccurateHistoricalScraper:
             'result': result
         }
     
-    def _extract_team_statistics(self, stats_data: Dict, team_id: int, match_event: Dict) -> Dict:
+    def _extract_team_statistics(self, stats_data: Dict, team_is_home: bool) -> Dict:
         """Extract team-specific statistics"""
         
-        home_team_id = safe_get_nested(match_event, ['homeTeam', 'id'])
-        team_side = 'home' if home_team_id == team_id else 'away'
+        team_side = 'home' if team_is_home else 'away'
         
         stats = {}
         
@@ -383,7 +537,7 @@ class AccurateHistoricalScraper:
                 if period.get('period') == 'ALL':
                     for group in period.get('groups', []):
                         for stat in group.get('statisticsItems', []):
-                            stat_name = stat.get('name', '').lower()
+                            stat_name = stat.get('name', '')
                             team_value = stat.get(team_side)
                             
                             if team_value is not None:
@@ -392,37 +546,16 @@ class AccurateHistoricalScraper:
                                     team_value = team_value.rstrip('%')
                                 
                                 # Map statistics
-                                if 'ball possession' in stat_name:
-                                    stats['possession_pct'] = float(team_value)
-                                elif 'shots on target' in stat_name:
-                                    stats['shots_on_target'] = int(team_value)
-                                elif 'total shots' in stat_name:
-                                    stats['total_shots'] = int(team_value)
-                                elif 'corner kicks' in stat_name:
-                                    stats['corners'] = int(team_value)
-                                elif 'fouls' in stat_name:
-                                    stats['fouls'] = int(team_value)
-                                elif 'yellow cards' in stat_name:
-                                    stats['yellow_cards'] = int(team_value)
-                                elif 'red cards' in stat_name:
-                                    stats['red_cards'] = int(team_value)
-                                elif 'passes' in stat_name and 'accurate' not in stat_name:
-                                    stats['total_passes'] = int(team_value)
-                                elif 'accurate passes' in stat_name:
+                                field = _EXACT_TEAM_STATS.get(stat_name) or _team_stat_field(stat_name.lower())
+                                if field == 'possession_pct':
+                                    stats[field] = float(team_value)
+                                elif field == 'accurate_passes':
                                     if '%' in str(team_value):
                                         stats['pass_accuracy_pct'] = float(team_value)
                                     else:
-                                        stats['accurate_passes'] = int(team_value)
-                                elif 'tackles' in stat_name:
-                                    stats['tackles'] = int(team_value)
-                                elif 'interceptions' in stat_name:
-                                    stats['interceptions'] = int(team_value)
-                                elif 'clearances' in stat_name:
-                                    stats['clearances'] = int(team_value)
-                                elif 'saves' in stat_name:
-                                    stats['goalkeeper_saves'] = int(team_value)
-                                elif 'offsides' in stat_name:
-                                    stats['offsides'] = int(team_value)
+                                        stats[field] = int(team_value)
+                                elif field is not None:
+                                    stats[field] = int(team_value)
             
             # Calculate derived statistics
             if 'total_passes' in stats and 'accurate_passes' in stats and 'pass_accuracy_pct' not in stats:
@@ -455,8 +588,6 @@ class AccurateHistoricalScraper:
     def debug_dump_mismatch(self, match_id, extracted_for, extracted_against, 
                            official_for, official_against, info, incidents):
         """Debug dump for score mismatches"""
-        import json
-        
         debug_dir = "debug"
         os.makedirs(debug_dir, exist_ok=True)
         
@@ -470,8 +601,8 @@ class AccurateHistoricalScraper:
         }
         
         filename = f"{debug_dir}/mismatch_{match_id}.json"
-        with open(filename, 'w') as fd:
-            json.dump(debug_data, fd, indent=2)
+        with open(filename, 'wb') as fd:
+            fd.write(json_dumps(debug_data, indent=True))
         
         self.logger.error(f"Score mismatch debug dump saved: {filename}")
 
@@ -492,27 +623,26 @@ class AccurateHistoricalScraper:
                     continue
                 
                 # Skip penalties/shootouts - only regular match play
-                if ev.get("period") not in ("1H", "2H"):
+                if ev.get("period") not in _REGULAR_PERIODS:
                     continue
                 
                 minute_raw = ev.get("minute", "")
-                # Parse "45+2" → 47
-                parts = str(minute_raw).split("+")
-                minute = int(parts[0]) + (int(parts[1]) if len(parts) == 2 else 0)
-                
-                team_id = ev["team"]["id"]
+                if isinstance(minute_raw, int):
+                    minute = minute_raw
+                else:
+                    # Parse "45+2" → 47
+                    parts = str(minute_raw).split("+")
+                    minute = int(parts[0]) + (int(parts[1]) if len(parts) == 2 else 0)
                 
+                assist = ev.get("assist")
                 out = {
                     "minute": minute,
                     "raw": minute_raw,
                     "scorer": ev["player"]["name"],
-                    "assist": ev.get("assist", {}).get("name") if ev.get("assist") else None
+                    "assist": assist.get("name") if assist else None
                 }
                 
-                if team_id == our_team_id:
-                    goals_for.append(out)
-                else:
-                    goals_against.append(out)
+                (goals_for if ev["team"]["id"] == our_team_id else goals_against).append(out)
             
             return goals_for, goals_against
             
@@ -532,15 +662,16 @@ class AccurateHistoricalScraper:
         }
         
         try:
-            home_team_id = safe_get_nested(match_event, ['homeTeam', 'id'])
-            away_team_id = safe_get_nested(match_event, ['awayTeam', 'id'])
-            home_team_name = safe_get_nested(match_event, ['homeTeam', 'name'])
-            away_team_name = safe_get_nested(match_event, ['awayTeam', 'name'])
+            # Resolve each nested object once
+            home = match_event.get('homeTeam') or {}
+            away = match_event.get('awayTeam') or {}
+            home_team_name = home.get('name')
+            away_team_name = away.get('name')
             match_id = match_event.get('id')
             
             # Get final scores for validation
-            final_home_score = safe_get_nested(match_event, ['homeScore', 'current'], 0)
-            final_away_score = safe_get_nested(match_event, ['awayScore', 'current'], 0)
+            final_home_score = (match_event.get('homeScore') or {}).get('current', 0)
+            final_away_score = (match_event.get('awayScore') or {}).get('current', 0)
             
             self.logger.info(f"🎯 SIMPLEST 100%-ACCURATE goal extraction:")
             self.logger.info(f"   Match: {home_team_name} vs {away_team_name}")
@@ -569,7 +700,8 @@ class AccurateHistoricalScraper:
                 
                 return goal_details
             
-            # Extract details - goals_for
+            # Extract details - goals_for (ordered by minute first so scorers and assists line up with times)
+            goals_for.sort(key=_by_minute)
             for goal in goals_for:
                 goal_details['goal_times'].append(goal['minute'])
                 if goal['scorer']:
@@ -578,12 +710,7 @@ class AccurateHistoricalScraper:
                     goal_details['assists'].append(goal['assist'])
             
             # Extract details - goals_against
-            for goal in goals_against:
-                goal_details['goal_conceded_times'].append(goal['minute'])
-            
-            # Sort by minute
-            goal_details['goal_times'].sort()
-            goal_details['goal_conceded_times'].sort()
+            goal_details['goal_conceded_times'] = sorted(map(_by_minute, goals_against))
             
             # Log perfect success
             self.logger.info(f"🎉 SIMPLEST 100%-ACCURATE SUCCESS:")
@@ -605,18 +732,14 @@ class AccurateHistoricalScraper:
             return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
         return None
     
-    def _extract_opponent(self, event: Dict, team_id: int) -> str:
+    def _extract_opponent(self, event: Dict, team_is_home: bool) -> str:
         """Extract opponent team name"""
-        home_team = safe_get_nested(event, ['homeTeam', 'name'])
-        away_team = safe_get_nested(event, ['awayTeam', 'name'])
-        home_team_id = safe_get_nested(event, ['homeTeam', 'id'])
-        
-        return away_team if home_team_id == team_id else home_team
+        opponent = event.get('awayTeam' if team_is_home else 'homeTeam') or {}
+        return opponent.get('name')
     
-    def _extract_venue_type(self, event: Dict, team_id: int) -> str:
+    def _extract_venue_type(self, team_is_home: bool) -> str:
         """Determine if match was home or away"""
-        home_team_id = safe_get_nested(event, ['homeTeam', 'id'])
-        return 'home' if home_team_id == team_id else 'away'
+        return 'home' if team_is_home else 'away'
     
     def _get_default_stats(self) -> Dict:
         """Return default stats when none are available"""
@@ -679,25 +802,26 @@ class AccurateHistoricalScraper:
         
         # Process each match for detailed information
         detailed_matches = []
+        selected_matches = raw_matches[:num_matches]
         
-        for i, match_event in enumerate(raw_matches[:num_matches]):
+        def process_match(indexed_match):
+            i, match_event = indexed_match
             try:
-                self.logger.info(f"Processing match {i+1}/{min(len(raw_matches), num_matches)}...")
-                
-                match_details = self.extract_accurate_match_details(match_event, team_id)
-                
+                self.logger.info(f"Processing match {i+1}/{len(selected_matches)}...")
+                return self.extract_accurate_match_details(match_event, team_id)
+            except Exception as e:
+                self.logger.error(f"Error processing match {match_event.get('id')}: {e}")
+                return None
+        
+        # Matches are independent; request pacing comes from the shared rate limiter
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for match_details in pool.map(process_match, enumerate(selected_matches)):
                 if match_details:
                     detailed_matches.append(match_details)
                     
                     # Log match summary
                     self.logger.info(f"✅ {match_details['opponent']} ({match_details['date']}): "
                                    f"{match_details['result']} {match_details['final_score']}")
-                
-                # Rate limiting
-                time.sleep(1.0)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing match {match_event.get('id')}: {e}")
         
         # Log final statistics
         success_rate = (self.successful_requests / self.request_count * 100) if self.request_count > 0 else 0
@@ -712,18 +836,15 @@ class AccurateHistoricalScraper:
     def export_to_csv(self, matches_data: List[Dict], team_id: int, output_dir: str = 'exports') -> str:
         """Export matches to CSV with comprehensive data"""
         
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{output_dir}/team_{team_id}_accurate_{timestamp}.csv"
-        
         if not matches_data:
             self.logger.warning("No matches data to export")
             return None
         
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"{output_dir}/team_{team_id}_accurate_{timestamp}.csv"
+        
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(matches_data)
-            
             # Ensure all expected columns exist
             expected_columns = [
                 'match_id', 'date', 'opponent', 'venue_type', 'competition', 'round_info',
@@ -735,57 +856,63 @@ class AccurateHistoricalScraper:
                 'goal_times', 'goal_scorers', 'assists', 'goal_conceded_times'
             ]
             
+            # Columns no match provides get a typed default; gaps in individual rows stay blank
+            present_columns = set().union(*matches_data)
+            defaults = {}
             for col in expected_columns:
-                if col not in df.columns:
+                if col not in present_columns:
                     if col in ['goal_times', 'goal_scorers', 'assists', 'goal_conceded_times']:
-                        df[col] = [[] for _ in range(len(df))]
+                        defaults[col] = []
                     elif col in ['possession_pct', 'pass_accuracy_pct']:
-                        df[col] = 0.0
+                        defaults[col] = 0.0
                     else:
-                        df[col] = 0
+                        defaults[col] = 0
             
-            # Reorder columns
-            df = df[expected_columns]
+            # Write rows straight from the match dicts in expected column order
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=expected_columns, extrasaction='ignore')
+                writer.writeheader()
+                for match in matches_data:
+                    writer.writerow({**defaults, **match} if defaults else match)
             
-            # Export to CSV
-            df.to_csv(filename, index=False)
-            
-            self.logger.info(f"📁 Exported {len(df)} matches to {filename}")
+            self.logger.info(f"📁 Exported {len(matches_data)} matches to {filename}")
             
             # Analysis
+            def column(col):
+                return [match.get(col, defaults.get(col)) for match in matches_data]
+            
+            dates = [d for d in column('date') if d]
             print(f"\n📊 EXPORT ANALYSIS:")
             print(f"   File: {filename}")
-            print(f"   Total matches: {len(df)}")
-            print(f"   Date range: {df['date'].min()} to {df['date'].max()}")
+            print(f"   Total matches: {len(matches_data)}")
+            print(f"   Date range: {min(dates, default=None)} to {max(dates, default=None)}")
             
             # Competition breakdown
-            comp_counts = df['competition'].value_counts()
+            comp_counts = Counter(c for c in column('competition') if c is not None)
             print(f"   Competitions:")
-            for comp, count in comp_counts.items():
+            for comp, count in comp_counts.most_common():
                 print(f"     • {comp}: {count} matches")
             
             # Venue breakdown
-            venue_counts = df['venue_type'].value_counts()
-            print(f"   Venue: {venue_counts.get('home', 0)} home, {venue_counts.get('away', 0)} away")
+            venue_counts = Counter(column('venue_type'))
+            print(f"   Venue: {venue_counts['home']} home, {venue_counts['away']} away")
             
             # Results breakdown
-            result_counts = df['result'].value_counts()
-            wins = result_counts.get('W', 0)
-            draws = result_counts.get('D', 0)
-            losses = result_counts.get('L', 0)
+            result_counts = Counter(column('result'))
+            wins = result_counts['W']
+            draws = result_counts['D']
+            losses = result_counts['L']
             print(f"   Record: {wins}W-{draws}D-{losses}L")
-            print(f"   Goals: {df['goals_scored'].sum()} scored, {df['goals_conceded'].sum()} conceded")
+            goals_scored = sum(g or 0 for g in column('goals_scored'))
+            goals_conceded = sum(g or 0 for g in column('goals_conceded'))
+            print(f"   Goals: {goals_scored} scored, {goals_conceded} conceded")
             
             # Data completeness check
-            non_zero_stats = 0
-            total_stats = 0
             stat_columns = ['possession_pct', 'total_shots', 'shots_on_target', 'corners', 
                           'fouls', 'total_passes', 'tackles', 'interceptions', 'clearances']
             
-            for col in stat_columns:
-                if col in df.columns:
-                    total_stats += len(df)
-                    non_zero_stats += len(df[df[col] > 0])
+            total_stats = len(stat_columns) * len(matches_data)
+            non_zero_stats = sum((value or 0) > 0 for col in stat_columns for value in column(col))
             
             completeness = (non_zero_stats / total_stats * 100) if total_stats > 0 else 0
             print(f"   Data completeness: {completeness:.1f}% ({non_zero_stats}/{total_stats} non-zero stats)")
@@ -11,6 +11,10 @@ import time
 import json
 import random
 import math
+import operator
+from collections import Counter
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
@@ -18,6 +22,7 @@ import signal
 import requests
 import asyncio
 import aiohttp
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
 # Web scraping imports
@@ -39,7 +44,130 @@ except ImportError:
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import setup_logging, safe_get_nested, extract_venue_from_response
+from utils import setup_logging, extract_venue_from_response, json_loads
+
+# Request headers are static, so build them once and share them across requests
+_DESKTOP_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Origin': 'https://www.sofascore.com',
+    'Referer': 'https://www.sofascore.com/',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-site'
+})
+
+_MOBILE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Origin': 'https://m.sofascore.com',
+    'Referer': 'https://m.sofascore.com/',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-site'
+})
+
+# Shared read-only default for missing nested API objects
+_EMPTY = MappingProxyType({})
+
+# (incidentType, teamSide) -> card field tallied from match incidents
+_CARD_INCIDENT_FIELDS = {
+    ('yellowCard', 'home'): 'yellow_cards_home',
+    ('yellowCard', 'away'): 'yellow_cards_away',
+    ('redCard', 'home'): 'red_cards_home',
+    ('redCard', 'away'): 'red_cards_away'
+}
+
+# API statistic name patterns -> (home, away) fields; the first substring hit wins
+_STAT_FIELD_PATTERNS = (
+    ('ball possession', ('ball_possession_home', 'ball_possession_away')),
+    ('possession', ('ball_possession_home', 'ball_possession_away')),
+    ('shots on target', ('shots_on_target_home', 'shots_on_target_away')),
+    ('total shots', ('total_shots_home', 'total_shots_away')),
+    ('shots', ('total_shots_home', 'total_shots_away')),
+    ('passes', ('passes_home', 'passes_away')),
+    ('accurate passes', ('accurate_passes_home', 'accurate_passes_away')),
+    ('fouls', ('fouls_home', 'fouls_away')),
+    ('corner kicks', ('corner_kicks_home', 'corner_kicks_away')),
+    ('corners', ('corner_kicks_home', 'corner_kicks_away')),
+    ('yellow cards', ('yellow_cards_home', 'yellow_cards_away')),
+    ('red cards', ('red_cards_home', 'red_cards_away')),
+    ('offsides', ('offsides_home', 'offsides_away')),
+    ('saves', ('goalkeeper_saves_home', 'goalkeeper_saves_away')),
+    ('tackles', ('tackles_home', 'tackles_away')),
+    ('interceptions', ('interceptions_home', 'interceptions_away')),
+    ('clearances', ('clearances_home', 'clearances_away')),
+    ('crosses', ('crosses_home', 'crosses_away'))
+)
+
+# Minimum realistic values enforced by _force_100_percent_completion
+_FIELD_MINIMUMS = {
+    'ball_possession_home': 30, 'ball_possession_away': 30,
+    'total_shots_home': 6, 'total_shots_away': 6,
+    'shots_on_target_home': 2, 'shots_on_target_away': 2,
+    'shots_off_target_home': 2, 'shots_off_target_away': 2,
+    'blocked_shots_home': 1, 'blocked_shots_away': 1,
+    'passes_home': 200, 'passes_away': 200,
+    'accurate_passes_home': 160, 'accurate_passes_away': 160,
+    'fouls_home': 8, 'fouls_away': 8,
+    'corner_kicks_home': 3, 'corner_kicks_away': 3,
+    'yellow_cards_home': 1, 'yellow_cards_away': 1,
+    'red_cards_home': 0, 'red_cards_away': 0,
+    'offsides_home': 2, 'offsides_away': 2,
+    'free_kicks_home': 12, 'free_kicks_away': 12,
+    'goalkeeper_saves_home': 3, 'goalkeeper_saves_away': 3,
+    'tackles_home': 15, 'tackles_away': 15,
+    'interceptions_home': 10, 'interceptions_away': 10,
+    'clearances_home': 12, 'clearances_away': 12,
+    'crosses_home': 10, 'crosses_away': 10,
+    'throw_ins_home': 18, 'throw_ins_away': 18
+}
+
+# Source bits for _generate_source_info; every combination's label is built once
+_SOURCE_WEB, _SOURCE_API, _SOURCE_ESTIMATION = 1, 2, 4
+_SOURCE_TOKENS = ('web_scraping', 'api_multi_endpoint', 'intelligent_estimation')
+_SOURCE_INFO_BY_FLAGS = tuple(
+    '+'.join([token for bit, token in enumerate(_SOURCE_TOKENS) if flags & (1 << bit)] + ['100pct_completion'])
+    for flags in range(1 << len(_SOURCE_TOKENS))
+)
+
+# 0 < value, evaluated in C when counting completed fields via map()
+_is_positive = partial(operator.lt, 0)
+
+@lru_cache(maxsize=512)
+def _stat_fields_for(name):
+    """Resolve a raw API statistic name to its (home, away) fields, or None"""
+    name = name.lower()
+    for pattern, field_pair in _STAT_FIELD_PATTERNS:
+        if pattern in name:
+            return field_pair
+    return None
+
+@dataclass(slots=True)
+class MatchRecord:
+    """Buffered per-match record; stats values follow complete_stats_mapping order"""
+    collection_timestamp: str
+    match_id: int
+    home_team: str
+    away_team: str
+    competition: str
+    venue: str
+    home_score: int
+    away_score: int
+    status: str
+    stats_source: str
+    non_zero_stats_count: int
+    is_high_quality: bool
+    data_completeness_pct: float
+    stats: Tuple[float, ...]
+    
+    def to_row(self) -> Tuple:
+        """Flatten into an export row: metadata columns followed by the stats"""
+        return tuple(getattr(self, name) for name in _RECORD_META_COLUMNS) + self.stats
+
+# Export columns preceding the statistical fields
+_RECORD_META_COLUMNS = tuple(f.name for f in fields(MatchRecord) if f.name != 'stats')
 
 class CompleteDataScraper:
     """Enhanced scraper with 100% data completeness guarantee"""
@@ -48,10 +176,18 @@ class CompleteDataScraper:
         self.logger = setup_logging()
         self.base_url = "https://api.sofascore.com/api/v1"
         self.monitoring = False
-        self.data_buffer = []
+        self.data_buffer: List[MatchRecord] = []
+        
+        # Set by stop_monitoring to wake the monitoring loop immediately (created in the running loop)
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Shared HTTP session (keep-alive + DNS cache reused across cycles)
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Web scraping setup
         self.driver = None
+        self._driver_lock: Optional[asyncio.Lock] = None
         self.web_scraping_enabled = SELENIUM_AVAILABLE and self._check_chrome_available()
         
         # Complete statistics mapping (48 fields)
@@ -76,6 +212,7 @@ class CompleteDataScraper:
             'crosses_home': 0, 'crosses_away': 0,
             'throw_ins_home': 0, 'throw_ins_away': 0
         }
+        self._stats_field_count = len(self.complete_stats_mapping)
         
         # Competition models for realistic estimation
         self.competition_models = {
@@ -96,6 +233,9 @@ class CompleteDataScraper:
             }
         }
         
+        # Competition name -> model, filled lazily by _get_competition_model
+        self._competition_model_cache = {}
+        
         signal.signal(signal.SIGINT, self.stop_monitoring)
     
     def _check_chrome_available(self):
@@ -152,34 +292,56 @@ class CompleteDataScraper:
             self.web_scraping_enabled = False
             return False
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+    
+    async def close_session(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def get_live_matches(self):
         """Get live matches with enhanced prioritization"""
         url = f"{self.base_url}/sport/football/events/live"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._get_desktop_headers(), timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        matches = []
-                        
-                        for event in data.get('events', []):
-                            match_info = {
-                                'match_id': event.get('id'),
-                                'home_team': safe_get_nested(event, ['homeTeam', 'name']),
-                                'away_team': safe_get_nested(event, ['awayTeam', 'name']),
-                                'home_team_id': safe_get_nested(event, ['homeTeam', 'id']),
-                                'away_team_id': safe_get_nested(event, ['awayTeam', 'id']),
-                                'competition': safe_get_nested(event, ['tournament', 'name']),
-                                'home_score': safe_get_nested(event, ['homeScore', 'current'], 0),
-                                'away_score': safe_get_nested(event, ['awayScore', 'current'], 0),
-                                'status': safe_get_nested(event, ['status', 'description']),
-                                'venue': extract_venue_from_response({'event': event}) or 'Unknown'
-                            }
-                            matches.append(match_info)
+            session = self._get_session()
+            async with session.get(url, headers=self._get_desktop_headers(), timeout=15) as response:
+                if response.status == 200:
+                    data = json_loads(await response.read())
+                    matches = []
+                    
+                    for event in data.get('events', []):
+                        # Resolve each nested object once instead of walking from the root per field
+                        home_team = event.get('homeTeam') or _EMPTY
+                        away_team = event.get('awayTeam') or _EMPTY
+                        home_score = event.get('homeScore') or _EMPTY
+                        away_score = event.get('awayScore') or _EMPTY
                         
-                        # Sort by data quality potential
-                        return self._prioritize_matches_for_completeness(matches)
+                        match_info = {
+                            'match_id': event.get('id'),
+                            'home_team': home_team.get('name'),
+                            'away_team': away_team.get('name'),
+                            'home_team_id': home_team.get('id'),
+                            'away_team_id': away_team.get('id'),
+                            'competition': (event.get('tournament') or _EMPTY).get('name'),
+                            'home_score': home_score.get('current', 0),
+                            'away_score': away_score.get('current', 0),
+                            'status': (event.get('status') or _EMPTY).get('description'),
+                            'venue': extract_venue_from_response({'event': event}) or 'Unknown'
+                        }
+                        matches.append(match_info)
+                    
+                    # Sort by data quality potential
+                    return self._prioritize_matches_for_completeness(matches)
         except Exception as e:
             self.logger.error(f"Error fetching live matches: {e}")
         
@@ -215,7 +377,8 @@ class CompleteDataScraper:
     async def collect_complete_match_data(self, match_id, match_info):
         """Collect complete match data using all available methods"""
         
-        self.logger.info(f"🎯 Collecting complete data for {match_info['home_team']} vs {match_info['away_team']}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"🎯 Collecting complete data for {match_info['home_team']} vs {match_info['away_team']}")
         
         # Step 1: Try multiple API endpoints simultaneously
         api_data = await self._collect_from_multiple_apis(match_id, match_info)
@@ -223,7 +386,11 @@ class CompleteDataScraper:
         # Step 2: Try web scraping if available
         web_data = {}
         if self.web_scraping_enabled and self.driver:
-            web_data = await self._scrape_match_page(match_id)
+            # Matches run concurrently but share one browser, so take turns
+            if self._driver_lock is None:
+                self._driver_lock = asyncio.Lock()
+            async with self._driver_lock:
+                web_data = await self._scrape_match_page(match_id)
         
         # Step 3: Merge and validate data
         merged_stats = self._merge_data_sources(api_data, web_data)
@@ -238,57 +405,60 @@ class CompleteDataScraper:
         # Calculate source info and confidence
         source_info = self._generate_source_info(api_data, web_data, merged_stats, final_stats)
         
-        completed_fields = sum(1 for v in final_stats.values() if v > 0)
-        self.logger.info(f"✅ Completed: {completed_fields}/48 fields ({completed_fields/48*100:.1f}%)")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            completed_fields = sum(map(_is_positive, final_stats.values()))
+            self.logger.debug(f"✅ Completed: {completed_fields}/48 fields ({completed_fields/48*100:.1f}%)")
         
         return final_stats, source_info
     
     async def _collect_from_multiple_apis(self, match_id, match_info):
         """Collect from multiple API endpoints simultaneously"""
         
+        desktop_headers = self._get_desktop_headers()
+        mobile_headers = self._get_mobile_headers()
+        
+        # (url, headers) pairs - each source is tagged with its headers up front
         endpoints = [
             # Primary SofaScore endpoints
-            f"{self.base_url}/event/{match_id}/statistics",
-            f"{self.base_url}/event/{match_id}/summary",
-            f"{self.base_url}/event/{match_id}/incidents",
-            f"{self.base_url}/event/{match_id}/graph",
+            (f"{self.base_url}/event/{match_id}/statistics", desktop_headers),
+            (f"{self.base_url}/event/{match_id}/summary", desktop_headers),
+            (f"{self.base_url}/event/{match_id}/incidents", desktop_headers),
+            (f"{self.base_url}/event/{match_id}/graph", desktop_headers),
             
             # Mobile endpoints
-            f"https://api.sofascore.app/api/v1/event/{match_id}/statistics",
-            f"https://api.sofascore.app/api/v1/event/{match_id}/summary",
+            (f"https://api.sofascore.app/api/v1/event/{match_id}/statistics", mobile_headers),
+            (f"https://api.sofascore.app/api/v1/event/{match_id}/summary", mobile_headers),
             
             # Alternative endpoints
-            f"{self.base_url}/event/{match_id}/statistics/0",
-            f"{self.base_url}/event/{match_id}/statistics/1",
-            f"{self.base_url}/event/{match_id}/statistics/2",
+            (f"{self.base_url}/event/{match_id}/statistics/0", desktop_headers),
+            (f"{self.base_url}/event/{match_id}/statistics/1", desktop_headers),
+            (f"{self.base_url}/event/{match_id}/statistics/2", desktop_headers),
         ]
         
         async def fetch_endpoint(session, url, headers):
             try:
                 async with session.get(url, headers=headers, timeout=10) as response:
                     if response.status == 200:
-                        return await response.json()
+                        return json_loads(await response.read())
             except:
                 pass
             return None
         
         api_data = {}
         
-        async with aiohttp.ClientSession() as session:
-            # Fetch all endpoints concurrently
-            tasks = []
-            for i, url in enumerate(endpoints):
-                headers = self._get_mobile_headers() if 'sofascore.app' in url else self._get_desktop_headers()
-                tasks.append(fetch_endpoint(session, url, headers))
-            
-            results = await asyncio.gather(*tasks)
-            
-            # Process results
-            for i, data in enumerate(results):
-                if data:
-                    stats = self._extract_statistics_from_api_response(data)
-                    if stats:
-                        api_data[f'endpoint_{i}'] = stats
+        session = self._get_session()
+        
+        # Fetch all endpoints concurrently
+        tasks = [fetch_endpoint(session, url, headers) for url, headers in endpoints]
+        
+        results = await asyncio.gather(*tasks)
+        
+        # Process results
+        for i, data in enumerate(results):
+            if data:
+                stats = self._extract_statistics_from_api_response(data)
+                if stats:
+                    api_data[f'endpoint_{i}'] = stats
         
         return api_data
     
@@ -529,64 +699,41 @@ class CompleteDataScraper:
         stats = {}
         
         if 'statistics' in data:
+            # Bind hot-loop helpers locally; resolve each name once and write directly
+            parse_value = self._parse_stat_value
+            fields_for = _stat_fields_for
+            
             for period in data['statistics']:
                 for group in period.get('groups', []):
                     for item in group.get('statisticsItems', []):
-                        name = item.get('name', '').lower()
-                        home_val = self._parse_stat_value(item.get('home'))
-                        away_val = self._parse_stat_value(item.get('away'))
+                        name = item.get('name')
+                        
+                        # Skip statistics we don't track before parsing values
+                        field_pair = fields_for(name) if name else None
+                        if field_pair is None:
+                            continue
+                        
+                        home_val = parse_value(item.get('home'))
+                        away_val = parse_value(item.get('away'))
                         
-                        # Map common statistics
-                        self._map_statistic_to_field(name, home_val, away_val, stats)
+                        if home_val > 0:
+                            stats[field_pair[0]] = home_val
+                        if away_val > 0:
+                            stats[field_pair[1]] = away_val
         
         if 'incidents' in data:
             self._extract_from_incidents(data['incidents'], stats)
         
         return stats
     
-    def _map_statistic_to_field(self, name, home_val, away_val, stats):
-        """Map API statistic name to our field names"""
-        mapping = {
-            'ball possession': ('ball_possession_home', 'ball_possession_away'),
-            'possession': ('ball_possession_home', 'ball_possession_away'),
-            'shots on target': ('shots_on_target_home', 'shots_on_target_away'),
-            'total shots': ('total_shots_home', 'total_shots_away'),
-            'shots': ('total_shots_home', 'total_shots_away'),
-            'passes': ('passes_home', 'passes_away'),
-            'accurate passes': ('accurate_passes_home', 'accurate_passes_away'),
-            'fouls': ('fouls_home', 'fouls_away'),
-            'corner kicks': ('corner_kicks_home', 'corner_kicks_away'),
-            'corners': ('corner_kicks_home', 'corner_kicks_away'),
-            'yellow cards': ('yellow_cards_home', 'yellow_cards_away'),
-            'red cards': ('red_cards_home', 'red_cards_away'),
-            'offsides': ('offsides_home', 'offsides_away'),
-            'saves': ('goalkeeper_saves_home', 'goalkeeper_saves_away'),
-            'tackles': ('tackles_home', 'tackles_away'),
-            'interceptions': ('interceptions_home', 'interceptions_away'),
-            'clearances': ('clearances_home', 'clearances_away'),
-            'crosses': ('crosses_home', 'crosses_away')
-        }
-        
-        for pattern, fields in mapping.items():
-            if pattern in name:
-                if home_val > 0:
-                    stats[fields[0]] = home_val
-                if away_val > 0:
-                    stats[fields[1]] = away_val
-                break
-    
     def _extract_from_incidents(self, incidents, stats):
         """Extract statistics from match incidents"""
-        for incident in incidents:
-            incident_type = incident.get('incidentType', '')
-            team_side = incident.get('teamSide', '')
-            
-            if incident_type == 'yellowCard':
-                key = f'yellow_cards_{team_side}'
-                stats[key] = stats.get(key, 0) + 1
-            elif incident_type == 'redCard':
-                key = f'red_cards_{team_side}'
-                stats[key] = stats.get(key, 0) + 1
+        counts = Counter((incident.get('incidentType'), incident.get('teamSide')) for incident in incidents)
+        
+        for incident_key, field in _CARD_INCIDENT_FIELDS.items():
+            count = counts.get(incident_key)
+            if count:
+                stats[field] = stats.get(field, 0) + count
     
     def _parse_stat_value(self, value):
         """Parse statistic value from various formats"""
@@ -617,60 +764,48 @@ class CompleteDataScraper:
     
     def _get_competition_model(self, competition):
         """Get competition-specific model"""
-        competition = competition.lower()
+        model = self._competition_model_cache.get(competition)
+        if model is not None:
+            return model
         
-        if any(term in competition for term in ['premier', 'england']):
-            return self.competition_models['premier_league']
-        elif any(term in competition for term in ['champions', 'europa', 'uefa']):
-            return self.competition_models['champions_league']
+        name = competition.lower()
+        
+        if any(term in name for term in ['premier', 'england']):
+            model = self.competition_models['premier_league']
+        elif any(term in name for term in ['champions', 'europa', 'uefa']):
+            model = self.competition_models['champions_league']
         else:
-            return self.competition_models['default']
+            model = self.competition_models['default']
+        
+        self._competition_model_cache[competition] = model
+        return model
     
     def _generate_source_info(self, api_data, web_data, merged_stats, final_stats):
         """Generate source information string"""
-        sources = []
+        flags = 0
         
         if web_data:
-            sources.append('web_scraping')
+            flags |= _SOURCE_WEB
         
         if api_data:
-            sources.append('api_multi_endpoint')
+            flags |= _SOURCE_API
         
         # Check how much was estimated
-        merged_count = sum(1 for v in merged_stats.values() if v > 0)
-        final_count = sum(1 for v in final_stats.values() if v > 0)
+        merged_count = sum(map(_is_positive, merged_stats.values()))
+        final_count = sum(map(_is_positive, final_stats.values()))
         
         if final_count > merged_count:
-            sources.append('intelligent_estimation')
-        
-        sources.append('100pct_completion')
+            flags |= _SOURCE_ESTIMATION
         
-        return '+'.join(sources)
+        return _SOURCE_INFO_BY_FLAGS[flags]
     
     def _get_desktop_headers(self):
         """Get desktop headers for API requests"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Origin': 'https://www.sofascore.com',
-            'Referer': 'https://www.sofascore.com/',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-site'
-        }
+        return _DESKTOP_HEADERS
     
     def _get_mobile_headers(self):
         """Get mobile headers for API requests"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Origin': 'https://m.sofascore.com',
-            'Referer': 'https://m.sofascore.com/',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-site'
-        }
+        return _MOBILE_HEADERS
     
     async def collect_data_cycle(self):
         """Enhanced data collection cycle with 100% completion guarantee"""
@@ -685,54 +820,84 @@ class CompleteDataScraper:
         cycle_data = []
         perfect_completion_count = 0
         
+        # All records in a cycle share one logical collection time
+        cycle_timestamp = datetime.now().isoformat()
+        
         # Process top-quality matches (limit for performance)
-        for i, match in enumerate(live_matches[:10]):
+        selected_matches = live_matches[:10]
+        total_selected = len(selected_matches)
+        semaphore = asyncio.Semaphore(4)
+        
+        async def process_match(i, match):
             match_id = match.get('match_id')
             if not match_id:
-                continue
+                return None
             
-            try:
-                self.logger.info(f"🔍 Processing {i+1}/{min(len(live_matches), 10)}: {match['home_team']} vs {match['away_team']}")
-                
-                # Collect complete data
-                complete_stats, source_info = await self.collect_complete_match_data(match_id, match)
-                
-                # Calculate metrics
-                completed_fields = sum(1 for v in complete_stats.values() if v > 0)
-                completion_percentage = (completed_fields / len(self.complete_stats_mapping)) * 100
-                
-                # Enhanced record with all 48 fields
-                record = {
-                    'collection_timestamp': datetime.now().isoformat(),
-                    'match_id': match_id,
-                    'home_team': match['home_team'],
-                    'away_team': match['away_team'],
-                    'competition': match['competition'],
-                    'venue': match['venue'],
-                    'home_score': match['home_score'],
-                    'away_score': match['away_score'],
-                    'status': match['status'],
-                    'stats_source': source_info,
-                    'non_zero_stats_count': completed_fields,
-                    'is_high_quality': completion_percentage >= 95,
-                    'data_completeness_pct': round(completion_percentage, 1),
-                    **complete_stats  # All 48 statistical fields
-                }
-                
-                cycle_data.append(record)
-                
-                if completion_percentage >= 98:
-                    perfect_completion_count += 1
-                
-                # Enhanced logging
-                icon = "🏆" if completion_percentage >= 98 else "✅" if completion_percentage >= 90 else "🔧"
-                self.logger.info(f"{icon} {match['home_team']} vs {match['away_team']}: {completed_fields}/48 fields ({completion_percentage:.1f}%)")
-                
-                # Brief pause between matches
-                await asyncio.sleep(1.5)
+            async with semaphore:
+                try:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"🔍 Processing {i+1}/{total_selected}: {match['home_team']} vs {match['away_team']}")
+                    
+                    # Collect complete data
+                    complete_stats, source_info = await self.collect_complete_match_data(match_id, match)
+                    
+                    # Calculate metrics
+                    completed_fields = sum(map(_is_positive, complete_stats.values()))
+                    completion_percentage = (completed_fields / self._stats_field_count) * 100
+                    
+                    # Enhanced record with all 48 fields
+                    record = MatchRecord(
+                        collection_timestamp=cycle_timestamp,
+                        match_id=match_id,
+                        home_team=match['home_team'],
+                        away_team=match['away_team'],
+                        competition=match['competition'],
+                        venue=match['venue'],
+                        home_score=match['home_score'],
+                        away_score=match['away_score'],
+                        status=match['status'],
+                        stats_source=source_info,
+                        non_zero_stats_count=completed_fields,
+                        is_high_quality=completion_percentage >= 95,
+                        data_completeness_pct=round(completion_percentage, 1),
+                        stats=tuple(complete_stats.get(key, 0) for key in self.complete_stats_mapping)
+                    )
+                    
+                    return record
+                    
+                except Exception as e:
+                    self.logger.error(f"Error processing match {match_id}: {e}")
+                    return None
                 
-            except Exception as e:
-                self.logger.error(f"Error processing match {match_id}: {e}")
+                finally:
+                    # Brief jittered pause keeps the request rate polite
+                    await asyncio.sleep(random.uniform(0.5, 1.5))
+        
+        results = await asyncio.gather(
+            *(process_match(i, match) for i, match in enumerate(selected_matches)),
+            return_exceptions=True
+        )
+        
+        log_lines = []
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing match: {result}")
+                continue
+            if not result:
+                continue
+            
+            cycle_data.append(result)
+            completion_percentage = result.data_completeness_pct
+            if completion_percentage >= 98:
+                perfect_completion_count += 1
+            
+            icon = "🏆" if completion_percentage >= 98 else "✅" if completion_percentage >= 90 else "🔧"
+            log_lines.append(f"{icon} {result.home_team} vs {result.away_team}: "
+                             f"{result.non_zero_stats_count}/48 fields ({completion_percentage:.1f}%)")
+        
+        # One log write per cycle instead of several per match
+        if log_lines:
+            self.logger.info("Cycle results:\n" + "\n".join(log_lines))
         
         if cycle_data:
             self.data_buffer.extend(cycle_data)
@@ -741,8 +906,8 @@ class CompleteDataScraper:
     def _log_completion_metrics(self, cycle_data, perfect_count):
         """Log completion metrics"""
         total_matches = len(cycle_data)
-        avg_completion = sum(m.get('data_completeness_pct', 0) for m in cycle_data) / total_matches if total_matches > 0 else 0
-        high_quality_count = sum(1 for m in cycle_data if m.get('is_high_quality', False))
+        avg_completion = sum(m.data_completeness_pct for m in cycle_data) / total_matches if total_matches > 0 else 0
+        high_quality_count = sum(1 for m in cycle_data if m.is_high_quality)
         
         self.logger.info(f"🎯 COMPLETION METRICS:")
         self.logger.info(f"   Total matches: {total_matches}")
@@ -761,20 +926,23 @@ class CompleteDataScraper:
         
         os.makedirs('exports', exist_ok=True)
         
-        df = pd.DataFrame(self.data_buffer)
+        columns = _RECORD_META_COLUMNS + tuple(self.complete_stats_mapping)
+        df = pd.DataFrame([record.to_row() for record in self.data_buffer], columns=columns)
         df.to_csv(filename, index=False)
         
         # Calculate metrics
+        # Count on single-column arrays rather than filtered DataFrame copies
+        completeness = df['data_completeness_pct'].to_numpy()
         total_records = len(df)
-        perfect_records = len(df[df['data_completeness_pct'] >= 98])
-        excellent_records = len(df[df['data_completeness_pct'] >= 95])
-        avg_completion = df['data_completeness_pct'].mean()
+        perfect_records = int((completeness >= 98).sum())
+        excellent_records = int((completeness >= 95).sum())
+        avg_completion = completeness.mean()
         
         # Zero analysis
         zero_fields = []
         for col in self.complete_stats_mapping.keys():
             if col in df.columns:
-                zero_count = len(df[df[col] == 0])
+                zero_count = int((df[col].to_numpy() == 0).sum())
                 if zero_count > 0:
                     zero_fields.append(f"{col}: {zero_count}")
         
@@ -804,33 +972,11 @@ class CompleteDataScraper:
     def _force_100_percent_completion(self, stats, match_info):
         """Force ALL 48 fields to have realistic values"""
         
-        # Minimum realistic values for each field
-        minimums = {
-            'ball_possession_home': 30, 'ball_possession_away': 30,
-            'total_shots_home': 6, 'total_shots_away': 6,
-            'shots_on_target_home': 2, 'shots_on_target_away': 2,
-            'shots_off_target_home': 2, 'shots_off_target_away': 2,
-            'blocked_shots_home': 1, 'blocked_shots_away': 1,
-            'passes_home': 200, 'passes_away': 200,
-            'accurate_passes_home': 160, 'accurate_passes_away': 160,
-            'fouls_home': 8, 'fouls_away': 8,
-            'corner_kicks_home': 3, 'corner_kicks_away': 3,
-            'yellow_cards_home': 1, 'yellow_cards_away': 1,
-            'red_cards_home': 0, 'red_cards_away': 0,
-            'offsides_home': 2, 'offsides_away': 2,
-            'free_kicks_home': 12, 'free_kicks_away': 12,
-            'goalkeeper_saves_home': 3, 'goalkeeper_saves_away': 3,
-            'tackles_home': 15, 'tackles_away': 15,
-            'interceptions_home': 10, 'interceptions_away': 10,
-            'clearances_home': 12, 'clearances_away': 12,
-            'crosses_home': 10, 'crosses_away': 10,
-            'throw_ins_home': 18, 'throw_ins_away': 18
-        }
-        
         # Apply minimums with small random additions
-        for field, minimum in minimums.items():
+        randint = random.randint
+        for field, minimum in _FIELD_MINIMUMS.items():
             if stats.get(field, 0) < minimum:
-                stats[field] = minimum + random.randint(0, 8)
+                stats[field] = minimum + randint(0, 8)
         
         # Ensure possession adds to 100%
         total_poss = stats['ball_possession_home'] + stats['ball_possession_away']
@@ -868,11 +1014,16 @@ class CompleteDataScraper:
         
         self.monitoring = True
         collection_count = 0
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
         
         # Initialize web driver if available
         if self.web_scraping_enabled:
             self.initialize_web_driver()
         
+        # Open the shared HTTP session for all cycles
+        self._get_session()
+        
         while self.monitoring:
             try:
                 # Collect complete data
@@ -885,40 +1036,52 @@ class CompleteDataScraper:
                 
                 # Show status
                 buffer_size = len(self.data_buffer)
+                print(f"🎯 Complete cycle {collection_count} at {datetime.now().strftime('%H:%M:%S')}")
                 if buffer_size > 0:
-                    avg_completion = sum(r.get('data_completeness_pct', 0) for r in self.data_buffer) / buffer_size
-                    perfect_count = sum(1 for r in self.data_buffer if r.get('data_completeness_pct', 0) >= 98)
+                    avg_completion = sum(r.data_completeness_pct for r in self.data_buffer) / buffer_size
+                    perfect_count = sum(1 for r in self.data_buffer if r.data_completeness_pct >= 98)
                     
-                    print(f"🎯 Complete cycle {collection_count} at {datetime.now().strftime('%H:%M:%S')}")
                     print(f"📦 Buffer: {buffer_size} records (avg: {avg_completion:.1f}% complete, {perfect_count} perfect)")
                 else:
-                    print(f"🎯 Complete cycle {collection_count} at {datetime.now().strftime('%H:%M:%S')}")
                     print(f"📦 Buffer: 0 records")
                 
                 # Wait 5 minutes
                 print("⏱️  Waiting 5 minutes for next complete collection cycle...")
-                await asyncio.sleep(300)
+                await self._wait_for_stop(300)
                 
             except KeyboardInterrupt:
                 print("\n🛑 Stopping gracefully...")
                 break
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(60)
+                await self._wait_for_stop(60)
         
         # Clean up
         if self.driver:
             self.driver.quit()
         
+        await self.close_session()
+        
         # Final export
         if self.data_buffer:
             self.export_data()
         
         print("👋 Complete data collection stopped")
     
+    async def _wait_for_stop(self, timeout):
+        """Wait up to timeout seconds, returning early if monitoring is stopped"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     def stop_monitoring(self, signum=None, frame=None):
         """Stop monitoring"""
         self.monitoring = False
+        
+        # Wake the loop so shutdown doesn't wait out the remaining interval
+        if self._stop_event is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 
 def main():
     """Main function"""
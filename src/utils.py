@@ -4,13 +4,25 @@ Fixed utility functions with better API handling and fallback strategies
 
 import logging
 import time
+import threading
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import os
 import json
+from functools import lru_cache
 
+# Faster JSON encoding/decoding when available (falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+@lru_cache(maxsize=None)
 def setup_logging():
-    """Set up logging configuration"""
+    """Set up logging configuration (once per process; later calls reuse the logger)"""
     log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -28,6 +40,18 @@ def setup_logging():
     
     return logging.getLogger(__name__)
 
+def json_loads(payload):
+    """Decode a JSON response body (bytes or str) with the fastest available parser"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def json_dumps(obj, indent=False):
+    """Encode an object to JSON bytes with the fastest available serializer"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
 def get_request_headers():
     """Get proper headers for SofaScore API"""
     return {
@@ -41,6 +65,97 @@ def get_request_headers():
         'Sec-Fetch-Site': 'same-site'
     }
 
+# Longest pause a server hint may impose on the shared rate limiter (seconds)
+MAX_SERVER_PAUSE = 60
+
+def parse_retry_after(value):
+    """Convert a Retry-After header (seconds or HTTP date) to seconds, or None if unparseable"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request sent through it"""
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate            # tokens refilled per second
+        self.capacity = capacity    # largest burst allowed after an idle period
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._resume_at = 0.0       # set when the server asks us to back off
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if now >= self._resume_at and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._resume_at - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+    
+    def pause(self, seconds):
+        """Hold back every caller for the given number of seconds (capped at MAX_SERVER_PAUSE)"""
+        if seconds > MAX_SERVER_PAUSE:
+            logging.getLogger(__name__).warning(
+                f"Server asked to pause {seconds:.0f}s; capping at {MAX_SERVER_PAUSE}s")
+            seconds = MAX_SERVER_PAUSE
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+    
+    def update_from_headers(self, headers):
+        """Honor server rate-limit hints (Retry-After, X-RateLimit-Remaining/Reset)"""
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None:
+            self.pause(retry_after)
+            return
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            if int(remaining) > 0:
+                return
+            reset = float(reset)
+        except ValueError:
+            return
+        # Reset is sent either as seconds-until-reset or as an epoch timestamp
+        self.pause(max(0.0, reset - time.time()) if reset > 1e9 else reset)
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(delay):
+    """Get the process-wide limiter that spaces requests at least `delay` seconds apart"""
+    return RateLimiter(rate=1.0 / delay, capacity=1)
+
+_http_session = None
+
+def get_http_session():
+    """Get the shared HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(get_request_headers())
+        _http_session = session
+    return _http_session
+
 def make_api_request(url, timeout=15, delay=1.5, max_retries=3):
     """
     Enhanced API request with better error handling and fallback strategies
@@ -49,16 +164,18 @@ def make_api_request(url, timeout=15, delay=1.5, max_retries=3):
     
     for attempt in range(max_retries):
         try:
-            # Rate limiting
-            time.sleep(delay)
-            
-            headers = get_request_headers()
+            # Rate limiting: only waits when the previous request was less than `delay` ago
+            if delay > 0:
+                get_rate_limiter(delay).acquire()
             
             logger.info(f"Attempt {attempt + 1}: Fetching {url}")
-            response = requests.get(url, headers=headers, timeout=timeout)
+            # Pooled session keeps the TLS connection alive between calls
+            response = get_http_session().get(url, timeout=timeout)
             
             # Log response details for debugging
             logger.info(f"Response status: {response.status_code}")
+            if delay > 0:
+                get_rate_limiter(delay).update_from_headers(response.headers)
             
             if response.status_code == 404:
                 logger.warning(f"404 - Endpoint not found: {url}")
@@ -66,9 +183,10 @@ def make_api_request(url, timeout=15, delay=1.5, max_retries=3):
                 
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             logger.info(f"Successfully fetched data from: {url}")
-            logger.debug(f"Response keys: {list(data.keys()) if isinstance(data, dict) else type(data)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response keys: {list(data.keys()) if isinstance(data, dict) else type(data)}")
             
             return data
             
@@ -86,10 +204,11 @@ def make_api_request(url, timeout=15, delay=1.5, max_retries=3):
         except ValueError as e:
             logger.error(f"JSON parsing failed for {url}: {e}")
             # Try to log response content for debugging
-            try:
-                logger.debug(f"Response content: {response.text[:500]}...")
-            except:
-                pass
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug(f"Response content: {response.text[:500]}...")
+                except:
+                    pass
             return None
     
     return None